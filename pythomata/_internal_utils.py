@@ -1,33 +1,65 @@
 # -*- coding: utf-8 -*-
 """Internal utility functions, not supposed to be used by the users."""
-from copy import deepcopy
-from typing import Set, Callable, Any, Iterable
+from collections import deque
+from typing import Set, Callable, Any, Iterable, Optional
 
 
 def least_fixpoint(starting_set: Set, step: Callable[[Set], Iterable]) -> Set:
-    """Do a least fixpoint algorithm."""
-    z_current = None
-    z_next = starting_set
+    """
+    Do a least fixpoint algorithm.
 
-    while z_current != z_next:
-        z_current = z_next
-        z_next = deepcopy(z_current)
-        z_next = z_next.union(step(z_current))
+    The computation is semi-naive: at every iteration, the step function
+    is applied only to the elements added in the previous iteration.
+    Hence, the step function must distribute over the union of sets,
+    i.e. step(A | B) == step(A) | step(B).
 
-    return z_current if z_current is not None else set()
+    :param starting_set: the initial set of elements.
+    :param step: the function that, given a set of elements, returns the new elements.
+    :return: the least fixpoint.
+    """
+    result = set(starting_set)
+    delta = set(starting_set)
 
+    while delta:
+        delta = set(step(delta)).difference(result)
+        result.update(delta)
 
-def greatest_fixpoint(starting_set: Set, condition: Callable[[Any, Set], bool]) -> Set:
-    """Do a greatest fixpoint algorithm."""
-    z_current = None
-    z_next = starting_set
+    return result
 
-    while z_current != z_next:
-        z_current = z_next
-        z_next = deepcopy(z_current)
 
-        for e in z_current:
-            if condition(e, z_current):
-                z_next.remove(e)
+def greatest_fixpoint(
+    starting_set: Set,
+    condition: Callable[[Any, Set], bool],
+    dependents: Optional[Callable[[Any, Set], Iterable]] = None,
+) -> Set:
+    """
+    Do a greatest fixpoint algorithm.
 
-    return z_current if z_current is not None else set()
+    The computation is worklist-based: an element is tested again
+    only if one of the elements it depends on has been removed.
+
+    :param starting_set: the initial set of elements.
+    :param condition: the function that says whether an element must be removed.
+    :param dependents: the function that, given a removed element and the
+                     | current set, returns the elements whose condition
+                     | might have changed. If None, all the remaining
+                     | elements are tested again.
+    :return: the greatest fixpoint.
+    """
+    result = set(starting_set)
+    worklist = deque(result)
+    queued = set(result)
+
+    while worklist:
+        e = worklist.popleft()
+        queued.discard(e)
+        if e not in result or not condition(e, result):
+            continue
+        result.discard(e)
+        affected = dependents(e, result) if dependents is not None else result
+        for d in affected:
+            if d in result and d not in queued:
+                queued.add(d)
+                worklist.append(d)
+
+    return result
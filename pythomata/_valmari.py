@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+The partition refinement of Valmari and Lehtinen, to minimize DFAs.
+
+For further details, see:
+- Efficient Minimization of DFAs with Partial Transition Functions
+  https://arxiv.org/abs/0802.2826
+"""
+from itertools import chain
+from typing import AbstractSet, Dict, Iterable, List, Tuple
+
+
+class _RefinablePartition:
+    """
+    A partition of the integers in [0, n) that can be refined in place.
+
+    The elements are stored in a single list, so that every set is a contiguous
+    slice of it; the marked elements of a set are moved at the beginning of its
+    slice, and splitting a set only requires to move the boundaries.
+    This is the data structure of Valmari and Lehtinen,
+    "Efficient minimization of DFAs with partial transition functions" (2008).
+    """
+
+    __slots__ = ("elements", "location", "set_of", "first", "end", "mid", "touched")
+
+    def __init__(self, nb_elements: int):
+        """
+        Initialize the partition with only one set.
+
+        :param nb_elements: the number of elements.
+        """
+        self.elements = list(range(nb_elements))  # type: List[int]
+        self.location = list(range(nb_elements))  # type: List[int]
+        self.set_of = [0] * nb_elements  # type: List[int]
+        self.first = [0]  # type: List[int]
+        self.end = [nb_elements]  # type: List[int]
+        self.mid = [0]  # type: List[int]
+        self.touched = []  # type: List[int]
+
+    @property
+    def nb_sets(self) -> int:
+        """Get the number of sets."""
+        return len(self.first)
+
+    def mark(self, elements: Iterable[int]) -> None:
+        """
+        Mark some elements, i.e. move them among the marked elements of their sets.
+
+        :param elements: the elements to mark.
+        :return: None
+        """
+        # this is the hot loop of the refinement: bind the lists once.
+        all_elements, location, set_of = self.elements, self.location, self.set_of
+        first, mid, touched = self.first, self.mid, self.touched
+        for element in elements:
+            set_index = set_of[element]
+            i = location[element]
+            j = mid[set_index]
+            if i < j:
+                continue
+            other = all_elements[j]
+            all_elements[i] = other
+            location[other] = i
+            all_elements[j] = element
+            location[element] = j
+            if j == first[set_index]:
+                touched.append(set_index)
+            mid[set_index] = j + 1
+
+    def split(self) -> None:
+        """
+        Split every set with some marked elements into marked and unmarked ones.
+
+        The new set gets the smallest part, and all the marks are removed.
+
+        :return: None
+        """
+        while self.touched:
+            set_index = self.touched.pop()
+            first, mid, end = (
+                self.first[set_index],
+                self.mid[set_index],
+                self.end[set_index],
+            )
+            self.mid[set_index] = first
+            if mid == end:
+                continue
+            if mid - first < end - mid:
+                new_first, new_end = first, mid
+                self.first[set_index] = self.mid[set_index] = mid
+            else:
+                new_first, new_end = mid, end
+                self.end[set_index] = mid
+            new_set_index = len(self.first)
+            self.first.append(new_first)
+            self.mid.append(new_first)
+            self.end.append(new_end)
+            for i in range(new_first, new_end):
+                self.set_of[self.elements[i]] = new_set_index
+
+
+def valmari_lehtinen_refinement(
+    nb_states: int,
+    accepting_states: AbstractSet[int],
+    live_states: AbstractSet[int],
+    transition_table: List[List[int]],
+) -> Tuple[List[int], int]:
+    """
+    Compute the coarsest partition of the states compatible with the language.
+
+    It is the algorithm of Valmari and Lehtinen, that works with
+    partial transition functions: the states that cannot reach any accepting
+    state are put in the same block, and their incoming transitions are ignored.
+
+    :param nb_states: the number of states, i.e. the integers in [0, nb_states).
+    :param accepting_states: the accepting states.
+    :param live_states: the states that can reach some accepting state.
+    :param transition_table: the successor of every state and action, or -1 if missing.
+    :return: a list that maps every state to the index of its block,
+           | and the index of the block of the states that cannot reach any accepting state
+           | (a fresh index if there is no such state).
+    """
+    dead_states = set(range(nb_states)).difference(live_states)
+
+    # the transitions towards dead states are ignored.
+    tails, heads = [], []  # type: List[int], List[int]
+    action2transitions = {}  # type: Dict[int, List[int]]
+    for state, next_states in enumerate(transition_table):
+        for action, next_state in enumerate(next_states):
+            if next_state in live_states:
+                action2transitions.setdefault(action, []).append(len(heads))
+                tails.append(state)
+                heads.append(next_state)
+
+    # the states are initially partitioned in accepting, non-accepting and dead;
+    # the transitions are initially partitioned by their label.
+    blocks = _RefinablePartition(nb_states)
+    for marked_states in (accepting_states, dead_states):
+        blocks.mark(marked_states)
+        blocks.split()
+    cords = _RefinablePartition(len(heads))
+    for transitions in action2transitions.values():
+        cords.mark(transitions)
+        cords.split()
+
+    _refine(blocks, cords, tails, heads)
+
+    sink = blocks.set_of[min(dead_states)] if dead_states else blocks.nb_sets
+    return blocks.set_of, sink
+
+
+def _refine(
+    blocks: "_RefinablePartition",
+    cords: "_RefinablePartition",
+    tails: List[int],
+    heads: List[int],
+) -> None:
+    """
+    Refine the partitions of states and transitions until they are compatible.
+
+    Every block but the first one, and every cord, is used exactly once as splitter.
+
+    :param blocks: the partition of the states.
+    :param cords: the partition of the transitions.
+    :param tails: the source state of every transition.
+    :param heads: the target state of every transition.
+    :return: None
+    """
+    incoming = [[] for _ in range(len(blocks.set_of))]  # type: List[List[int]]
+    for transition, head in enumerate(heads):
+        incoming[head].append(transition)
+
+    block_index, cord_index = 1, 0
+    while cord_index < cords.nb_sets:
+        cord = cords.elements[cords.first[cord_index] : cords.end[cord_index]]
+        blocks.mark(map(tails.__getitem__, cord))
+        blocks.split()
+        cord_index += 1
+        while block_index < blocks.nb_sets:
+            block = blocks.elements[blocks.first[block_index] : blocks.end[block_index]]
+            cords.mark(chain.from_iterable(map(incoming.__getitem__, block)))
+            cords.split()
+            block_index += 1
@@ -1,7 +1,17 @@
 # -*- coding: utf-8 -*-
 """This module provides many popular alphabets."""
 import itertools
-from typing import List, Tuple, Iterable, Iterator, Generic, Union, Collection, Set
+from typing import (
+    List,
+    Tuple,
+    Iterable,
+    Iterator,
+    Generic,
+    Union,
+    Collection,
+    Set,
+    Dict,
+)
 
 from pythomata.core import Alphabet, SymbolType
 
@@ -10,13 +20,22 @@ AlphabetLike = Union[Alphabet[SymbolType], Collection[SymbolType], Set[SymbolTyp
 IndexNotFound = ValueError("No symbol for that index.")
 SymbolNotFound = ValueError("No symbol for that index.")
 
+_BINARY_DIGITS = frozenset("01")
+
 
 class ArrayAlphabet(Alphabet[SymbolType]):
     """An alphabet implemented with an array."""
 
+    __slots__ = ("symbols", "_index", "size")
+
     def __init__(self, symbols: List[SymbolType]):
         """Initialize the array alphabet."""
         self.symbols = tuple(symbols)  # type: Tuple[SymbolType, ...]
+        # like list.index, a duplicated symbol maps to its first occurrence.
+        self._index = {}  # type: Dict[SymbolType, int]
+        for idx, symbol in enumerate(self.symbols):
+            self._index.setdefault(symbol, idx)
+        self.size = len(self.symbols)  # type: int
 
     def get_symbol(self, index: int) -> SymbolType:
         """
@@ -48,24 +67,31 @@ class ArrayAlphabet(Alphabet[SymbolType]):
 
     def __get_symbol_index(self, symbol: SymbolType) -> int:
         """
-        Iterate over the list of symbols and find the index.
+        Look up the index of a symbol.
 
         :param symbol: the symbol whose index is requested.
         :return: its index, or -1 if not found.
         """
-        for idx, sym in enumerate(self.symbols):
-            if sym == symbol:
-                return idx
-        return -1
+        try:
+            return self._index.get(symbol, -1)
+        except TypeError:
+            # an unhashable symbol cannot be in the alphabet.
+            return -1
 
-    @property
-    def size(self) -> int:
+    def contains(self, symbol: SymbolType) -> bool:
         """
-        Get the size of the alphabet.
+        Check if a symbol is part of the alphabet.
 
-        :return: the size of the alphabet.
+        The check is a single lookup in the index of the symbols.
+
+        :param symbol: the symbol.
+        :return: True if the symbol if part of the alphabet, False otherwise.
         """
-        return len(self.symbols)
+        try:
+            return symbol in self._index
+        except TypeError:
+            # an unhashable symbol cannot be in the alphabet.
+            return False
 
     def __iter__(self) -> Iterable[SymbolType]:
         """Iterate over the alphabet."""
@@ -75,10 +101,15 @@ class ArrayAlphabet(Alphabet[SymbolType]):
 class MapAlphabet(Alphabet[SymbolType]):
     """An alphabet implemented with a mapping."""
 
+    __slots__ = ("symbols", "symbol_to_index", "size")
+
     def __init__(self, symbols: Iterable[SymbolType]):
         """Initialize the array alphabet."""
         self.symbols = tuple(symbols)  # type: Tuple[SymbolType, ...]
-        self.symbol_to_index = dict(map(reversed, enumerate(symbols)))  # type: ignore
+        self.symbol_to_index = {
+            symbol: idx for idx, symbol in enumerate(self.symbols)
+        }  # type: Dict[SymbolType, int]
+        self.size = len(self.symbols)  # type: int
 
     def get_symbol(self, index: int) -> SymbolType:
         """
@@ -103,14 +134,20 @@ class MapAlphabet(Alphabet[SymbolType]):
         """
         return self.symbol_to_index[symbol]
 
-    @property
-    def size(self) -> int:
+    def contains(self, symbol: SymbolType) -> bool:
         """
-        Get the size of the alphabet.
+        Check if a symbol is part of the alphabet.
+
+        The check is a single lookup in the index of the symbols.
 
-        :return: the size of the alphabet.
+        :param symbol: the symbol.
+        :return: True if the symbol if part of the alphabet, False otherwise.
         """
-        return len(self.symbols)
+        try:
+            return symbol in self.symbol_to_index
+        except TypeError:
+            # an unhashable symbol cannot be in the alphabet.
+            return False
 
     def __iter__(self):
         """Iterate over the alphabet."""
@@ -125,6 +162,8 @@ class RangeIntAlphabet(Alphabet[int]):
     but it only stores the start and the end element of the range.
     """
 
+    __slots__ = ("r", "size")
+
     def __init__(self, stop: int, start: int = 0, step: int = 1):
         """
         Initialize the range (start included, end NOT included).
@@ -135,6 +174,7 @@ class RangeIntAlphabet(Alphabet[int]):
         """
         assert start < stop, "Start must be lower than stop."
         self.r = range(start, stop, step)
+        self.size = len(self.r)  # type: int
 
     def get_symbol(self, index: int) -> int:
         """Get the symbol associated to the index."""
@@ -145,16 +185,16 @@ class RangeIntAlphabet(Alphabet[int]):
 
     def get_symbol_index(self, symbol: int) -> int:
         """Get the index, given the symbol."""
-        return self.r.index(symbol)
-
-    @property
-    def size(self) -> int:
-        """Get the size of the alphabet."""
-        return len(self.r)
+        if not isinstance(symbol, int):
+            raise SymbolNotFound
+        index, offset = divmod(symbol - self.r.start, self.r.step)
+        if offset != 0 or not 0 <= index < len(self.r):
+            raise SymbolNotFound
+        return index
 
     def __iter__(self):
         """Iterate over the alphabet."""
-        return self.r
+        return iter(self.r)
 
 
 def from_array(symbols: Iterable[SymbolType]) -> Alphabet:
@@ -170,6 +210,8 @@ class VectorizedAlphabet(Generic[SymbolType], Alphabet[Tuple[SymbolType, ...]]):
     are vectors of symbols of the original alphabet.
     """
 
+    __slots__ = ("_alphabet", "n", "_base", "_powers", "size")
+
     def __init__(self, alphabet: Alphabet[SymbolType], n: int):
         """
         Initialize the vectorized alphabet.
@@ -180,43 +222,37 @@ class VectorizedAlphabet(Generic[SymbolType], Alphabet[Tuple[SymbolType, ...]]):
         """
         self._alphabet = alphabet
         self.n = n
+        self._base = alphabet.size
+        # powers of the base, from the most significant position to the least one.
+        self._powers = tuple(
+            self._base ** i for i in range(n - 1, -1, -1)
+        )  # type: Tuple[int, ...]
+        self.size = self._base ** n  # type: int
 
     def get_symbol(self, index: int) -> Tuple[SymbolType, ...]:
         """Get the symbol from an index."""
+        get_symbol = self._alphabet.get_symbol
         symbol_vector = []
         reminder_index = index
-        i = self.n - 1
-        while i >= 0:
-            new_index = reminder_index // (self._alphabet.size ** i)
-            new_symbol = self._alphabet.get_symbol(new_index)
-            symbol_vector.append(new_symbol)
-            reminder_index %= self._alphabet.size ** i
-            i -= 1
+        for power in self._powers:
+            new_index, reminder_index = divmod(reminder_index, power)
+            symbol_vector.append(get_symbol(new_index))
         return tuple(symbol_vector)
 
     def get_symbol_index(self, vector: Tuple[SymbolType, ...]) -> int:
         """Get the index of a symbol."""
         if len(vector) != self.n:
             raise SymbolNotFound
+        get_symbol_index = self._alphabet.get_symbol_index
+        base = self._base
         index_of_vector = 0
-        for _position, symbol in enumerate(vector):
-            index = self._alphabet.get_symbol_index(symbol)
-            index_of_vector = index_of_vector * self._alphabet.size
-            index_of_vector += index
+        for symbol in vector:
+            index_of_vector = index_of_vector * base + get_symbol_index(symbol)
         return index_of_vector
 
-    @property
-    def size(self) -> int:
-        """Get the size of the alphabet."""
-        return self._alphabet.size ** self.n
-
     def __iter__(self) -> Iterator[Tuple[SymbolType, ...]]:
         """Iterate over the alphabet."""
-        index_vector_iterable = itertools.product(range(self.size), repeat=self.n)
-        return map(
-            lambda x: tuple([self._alphabet.get_symbol(idx) for idx in x]),
-            index_vector_iterable,
-        )
+        return itertools.product(self._alphabet, repeat=self.n)
 
 
 class SymbolicAlphabet(Alphabet[str]):
@@ -247,6 +283,8 @@ class SymbolicAlphabet(Alphabet[str]):
     ValueError: No symbol for that index.
     """
 
+    __slots__ = ("nb_propositions", "size")
+
     def __init__(self, nb_propositions: int):
         """
         Initialize a Symbolic Alphabet.
@@ -254,23 +292,31 @@ class SymbolicAlphabet(Alphabet[str]):
         :param nb_propositions: the number of propositions.
         """
         self.nb_propositions = nb_propositions
-        self._inner_alphabet = VectorizedAlphabet(
-            ArrayAlphabet[str](["0", "1"]), nb_propositions
-        )
+        self.size = 1 << nb_propositions  # type: int
 
     def get_symbol(self, index: int) -> str:
         """Get a symbol given its index."""
-        return "".join(self._inner_alphabet.get_symbol(index))
+        if not 0 <= index < self.size:
+            raise IndexNotFound
+        if self.nb_propositions == 0:
+            return ""
+        # the symbol is the binary representation of the index.
+        return format(index, "0{}b".format(self.nb_propositions))
 
     def get_symbol_index(self, symbol: str) -> int:
         """Get the index of a symbol."""
-        return self._inner_alphabet.get_symbol_index(tuple(symbol))
-
-    @property
-    def size(self) -> int:
-        """Get the size of the alphabet."""
-        return self._inner_alphabet.size
+        if not isinstance(symbol, str):
+            # a sequence of '0' and '1' symbols is accepted as well.
+            try:
+                symbol = "".join(symbol)
+            except TypeError:
+                raise SymbolNotFound
+        if len(symbol) != self.nb_propositions or not _BINARY_DIGITS.issuperset(
+            symbol
+        ):
+            raise SymbolNotFound
+        return int(symbol, 2) if symbol else 0
 
     def __iter__(self):
         """Iterate over the alphabet."""
-        return iter(self._inner_alphabet)
+        return map("".join, itertools.product("01", repeat=self.nb_propositions))
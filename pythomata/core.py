@@ -1,8 +1,22 @@
 # -*- coding: utf-8 -*-
 """The core module."""
 from abc import ABC, abstractmethod
-from functools import reduce
-from typing import TypeVar, Generic, AbstractSet, Optional, Tuple, Dict, Any, Sequence
+from collections import defaultdict
+from itertools import chain
+from typing import (
+    TypeVar,
+    Generic,
+    AbstractSet,
+    Optional,
+    Tuple,
+    Dict,
+    Any,
+    DefaultDict,
+    Sequence,
+    Iterable,
+    List,
+    Set,
+)
 
 import graphviz
 
@@ -15,6 +29,8 @@ TransitionType = Tuple[StateType, GuardType, StateType]
 class Alphabet(Generic[SymbolType], ABC):
     """Abstract class to represent a finite alphabet."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get_symbol(self, index: int) -> SymbolType:
         """
@@ -69,6 +85,8 @@ class Alphabet(Generic[SymbolType], ABC):
 
     def __eq__(self, other) -> bool:
         """Check that two alphabet are equal."""
+        if other is self:
+            return True
         return isinstance(other, Alphabet) and set(self) == set(other)
 
 
@@ -91,8 +109,12 @@ class FiniteAutomaton(Generic[StateType, SymbolType, GuardType], ABC):
 
     def __init__(self):
         """Initialize the finite automaton."""
-        self._state_attributes = {}  # type: Dict[StateType, Dict[str, Any]]
-        self._transition_attributes = {}  # type: Dict[TransitionType, Dict[str, Any]]
+        self._state_attributes = defaultdict(
+            dict
+        )  # type: DefaultDict[StateType, Dict[str, Any]]
+        self._transition_attributes = defaultdict(
+            dict
+        )  # type: DefaultDict[TransitionType, Dict[str, Any]]
 
     @property
     @abstractmethod
@@ -156,11 +178,7 @@ class FiniteAutomaton(Generic[StateType, SymbolType, GuardType], ABC):
 
         :return: the set of transitions.
         """
-        transitions = set()
-        for state in self.states:
-            for start_state, guard, end_state in self.get_transitions_from(state):
-                transitions.add((start_state, guard, end_state))
-        return transitions
+        return set(chain.from_iterable(map(self.get_transitions_from, self.states)))
 
     def get_state_attribute(self, state: StateType, attr_name: str) -> Optional[Any]:
         """
@@ -183,7 +201,7 @@ class FiniteAutomaton(Generic[StateType, SymbolType, GuardType], ABC):
         :param attr_value: the attribute value.
         :return: the attribute value.
         """
-        self._state_attributes.get(state, {})[attr_name] = attr_value
+        self._state_attributes[state][attr_name] = attr_value
 
     def get_transition_attribute(
         self, transition: TransitionType, attr_name: str
@@ -208,7 +226,7 @@ class FiniteAutomaton(Generic[StateType, SymbolType, GuardType], ABC):
         :param attr_value: the attribute value.
         :return: the attribute value.
         """
-        self._transition_attributes.get(transition, {})[attr_name] = attr_value
+        self._transition_attributes[transition][attr_name] = attr_value
 
     @property
     def size(self) -> int:
@@ -238,16 +256,27 @@ class FiniteAutomaton(Generic[StateType, SymbolType, GuardType], ABC):
         :param word: the list of symbols.
         :return: True if the automaton accepts the word, False otherwise.
         """
+        get_successors = self.get_successors
         current_states = {self.initial_state}  # type: AbstractSet[StateType]
         for symbol in word:
-            current_states = reduce(
-                set.union,  # type: ignore
-                map(lambda x: self.get_successors(x, symbol), current_states),
-                set(),
-            )
+            next_states = set()  # type: Set[StateType]
+            for state in current_states:
+                next_states.update(get_successors(state, symbol))
+            if not next_states:
+                return False
+            current_states = next_states
 
         return any(self.is_accepting(state) for state in current_states)
 
+    def accepts_words(self, words: Iterable[Sequence[SymbolType]]) -> List[bool]:
+        """
+        Check whether the automaton accepts each of the words.
+
+        :param words: the words, i.e. lists of symbols.
+        :return: the list of the results, in the same order of the words.
+        """
+        return [self.accepts(word) for word in words]
+
 
 class DFA(
     FiniteAutomaton[StateType, SymbolType, GuardType],
@@ -273,6 +302,23 @@ class DFA(
         successor = self.get_successor(state, symbol)
         return {successor} if successor is not None else set()
 
+    def accepts(self, word: Sequence[SymbolType]) -> bool:
+        """
+        Check whether the automaton accepts the word.
+
+        The automaton is deterministic: only one current state is kept.
+
+        :param word: the list of symbols.
+        :return: True if the automaton accepts the word, False otherwise.
+        """
+        get_successor = self.get_successor
+        current_state = self.initial_state
+        for symbol in word:
+            current_state = get_successor(current_state, symbol)
+            if current_state is None:
+                return False
+        return self.is_accepting(current_state)
+
 
 class Rendering(
     FiniteAutomaton[StateType, SymbolType, GuardType],
@@ -288,23 +334,35 @@ class Rendering(
         :return: the graphviz.Digraph object.
         :raise ValueError: if it was not possible to compute the graph.
         """
+        initial_state = self.initial_state
+        accepting_states = self.accepting_states
+        # every state is converted to string only once, and reused in the edges.
+        state2name = {state: str(state) for state in self.states}
+
         graph = graphviz.Digraph(format="svg")
         graph.node("fake", style="invisible")
-        for state in self.states:
-            if state == self.initial_state:
-                if state in self.accepting_states:
-                    graph.node(str(state), root="true", shape="doublecircle")
+        for state, name in state2name.items():
+            if state == initial_state:
+                if state in accepting_states:
+                    graph.node(name, root="true", shape="doublecircle")
                 else:
-                    graph.node(str(state), root="true")
-            elif state in self.accepting_states:
-                graph.node(str(state), shape="doublecircle")
+                    graph.node(name, root="true")
+            elif state in accepting_states:
+                graph.node(name, shape="doublecircle")
             else:
-                graph.node(str(state))
-
-        graph.edge("fake", str(self.initial_state), style="bold")
-
-        for (start, guard, end) in self.get_transitions():
-            graph.edge(str(start), str(end), label=str(guard))
+                graph.node(name)
+
+        graph.edge("fake", state2name[initial_state], style="bold")
+
+        # the transitions of different states are distinct: no need to collect them.
+        # the guards are shared among many transitions: convert each of them once.
+        guard2label = {}  # type: Dict[GuardType, str]
+        for state in state2name:
+            for start, guard, end in self.get_transitions_from(state):
+                label = guard2label.get(guard, None)
+                if label is None:
+                    label = guard2label[guard] = str(guard)
+                graph.edge(state2name[start], state2name[end], label=label)
 
         return graph
 
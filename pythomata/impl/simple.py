@@ -1,12 +1,23 @@
 # -*- coding: utf-8 -*-
 """This package contains naive implementations of DFA and NFA."""
-import itertools
 import pprint
-import queue
-from copy import deepcopy, copy
-from typing import Set, Dict, Tuple, FrozenSet, Iterable, cast, AbstractSet, Generic
+from collections import deque
+from itertools import chain
+from typing import (
+    Set,
+    Dict,
+    Tuple,
+    FrozenSet,
+    cast,
+    AbstractSet,
+    Generic,
+    List,
+    Sequence,
+    Optional,
+    Iterable,
+)
 
-from pythomata._internal_utils import greatest_fixpoint, least_fixpoint
+from pythomata._valmari import valmari_lehtinen_refinement
 from pythomata.alphabets import MapAlphabet, AlphabetLike
 from pythomata.core import (
     StateType,
@@ -17,7 +28,6 @@ from pythomata.core import (
     Rendering,
     TransitionType,
 )
-from pythomata.utils import powerset
 
 
 class SimpleDFA(
@@ -59,12 +69,61 @@ class SimpleDFA(
         self._check_input(
             states, alphabet, initial_state, accepting_states, transition_function
         )
+        self._setup(
+            states, alphabet, initial_state, accepting_states, transition_function
+        )
+
+    @classmethod
+    def _unchecked(
+        cls,
+        states: Set[StateType],
+        alphabet: Alphabet[SymbolType],
+        initial_state: StateType,
+        accepting_states: Set[StateType],
+        transition_function: Dict[StateType, Dict[SymbolType, StateType]],
+    ) -> "SimpleDFA":
+        """
+        Initialize a DFA without checking the consistency of the parameters.
+
+        It is meant for the DFAs built by the operations of this class,
+        that are consistent by construction.
+
+        :param states: the set of states.
+        :param alphabet: the alphabet
+        :param initial_state: the initial state
+        :param accepting_states: the set of accepting states
+        :param transition_function: the transition function
+        :return: the DFA.
+        """
+        dfa = cls.__new__(cls)
+        super(SimpleDFA, dfa).__init__()
+        dfa._setup(
+            states, alphabet, initial_state, accepting_states, transition_function
+        )
+        return dfa
 
-        self._states = states
+    def _setup(
+        self,
+        states: Set[StateType],
+        alphabet: Alphabet[SymbolType],
+        initial_state: StateType,
+        accepting_states: Set[StateType],
+        transition_function: Dict[StateType, Dict[SymbolType, StateType]],
+    ):
+        """Set the components of the DFA and build the indexes."""
+        self._states = frozenset(states)  # type: FrozenSet[StateType]
         self._alphabet = alphabet
         self._initial_state = initial_state
-        self._accepting_states = accepting_states
+        self._accepting_states = frozenset(
+            accepting_states
+        )  # type: FrozenSet[StateType]
         self._transition_function = transition_function
+        self._completed = None  # type: Optional[SimpleDFA]
+        self._minimized = None  # type: Optional[SimpleDFA]
+        self._transitions_from = (
+            {}
+        )  # type: Dict[StateType, FrozenSet[TransitionType]]
+        self._predecessors = None  # type: Optional[List[List[int]]]
 
         self._build_indexes()
 
@@ -85,7 +144,7 @@ class SimpleDFA(
 
     def get_successor(self, state: StateType, symbol: SymbolType) -> StateType:
         """Get the successor."""
-        return self.transition_function.get(state, {}).get(symbol, None)
+        return self._transition_function.get(state, {}).get(symbol, None)
 
     @property
     def states(self) -> Set[StateType]:
@@ -93,9 +152,21 @@ class SimpleDFA(
         return set(self._states)
 
     @property
-    def accepting_states(self) -> Set[StateType]:
+    def accepting_states(self) -> FrozenSet[StateType]:
         """Get the set of accepting states."""
-        return set(self._accepting_states)
+        return self._accepting_states
+
+    def is_accepting(self, state: StateType) -> bool:
+        """
+        Check whether a state is accepting.
+
+        :param state: the state of the automaton.
+        :return: True if the state is accepting, false otherwise.
+        :raise ValueError: if the state does not belong to the automaton.
+        """
+        if state not in self._states:
+            raise ValueError("The state does not belong to the automaton.")
+        return state in self._accepting_states
 
     @classmethod
     def _check_input(
@@ -123,33 +194,43 @@ class SimpleDFA(
     def _build_indexes(self):
         """Build indexes for several components of the object."""
         self._idx_to_state = list(self._states)
-        self._state_to_idx = dict(map(reversed, enumerate(self._idx_to_state)))
+        self._state_to_idx = {s: i for i, s in enumerate(self._idx_to_state)}
         self._idx_to_symbol = list(self._alphabet)
-        self._symbol_to_idx = dict(map(reversed, enumerate(self._idx_to_symbol)))
-
-        # state -> action -> state
-        self._idx_transition_function = {
-            self._state_to_idx[state]: {
-                self._symbol_to_idx[symbol]: self._state_to_idx[
-                    self._transition_function[state][symbol]
+        self._symbol_to_idx = {a: i for i, a in enumerate(self._idx_to_symbol)}
+
+        # state -> action -> state, as a dense table. -1 means no transition.
+        self._idx_delta = [
+            [-1] * len(self._idx_to_symbol) for _ in self._idx_to_state
+        ]  # type: List[List[int]]
+        for state, symbol2next_state in self._transition_function.items():
+            next_states = self._idx_delta[self._state_to_idx[state]]
+            for symbol, next_state in symbol2next_state.items():
+                next_states[self._symbol_to_idx[symbol]] = self._state_to_idx[
+                    next_state
                 ]
-                for symbol in self._transition_function.get(state, {})
-            }
-            for state in self._states
-        }
-
-        # state -> (action, state)
-        self._idx_delta_by_state = {}
-        for s in self._idx_transition_function:
-            self._idx_delta_by_state[s] = set(
-                list(self._idx_transition_function[s].items())
-            )
 
         self._idx_initial_state = self._state_to_idx[self._initial_state]
         self._idx_accepting_states = frozenset(
             self._state_to_idx[s] for s in self.accepting_states
         )
 
+    def _idx_predecessors(self) -> List[List[int]]:
+        """
+        Get the predecessors of every state, i.e. the inverse of the transition table.
+
+        The index is built at the first call only.
+
+        :return: the list of the predecessors of every state.
+        """
+        if self._predecessors is None:
+            predecessors = [[] for _ in self._idx_to_state]  # type: List[List[int]]
+            for state, next_states in enumerate(self._idx_delta):
+                for next_state in next_states:
+                    if next_state != -1:
+                        predecessors[next_state].append(state)
+            self._predecessors = predecessors
+        return self._predecessors
+
     def __eq__(self, other):
         """Check equality with another object."""
         if not isinstance(other, SimpleDFA):
@@ -188,11 +269,7 @@ class SimpleDFA(
 
         :return: True if the automaton is complete, False otherwise.
         """
-        complete_number_of_transitions = len(self.states) * len(self.alphabet)
-        current_number_of_transitions = sum(
-            len(self._transition_function[state]) for state in self._transition_function
-        )
-        return complete_number_of_transitions == current_number_of_transitions
+        return all(-1 not in next_states for next_states in self._idx_delta)
 
     def complete(self) -> "SimpleDFA":
         """
@@ -203,8 +280,9 @@ class SimpleDFA(
         """
         if self.is_complete():
             return self
-        else:
-            return self._complete()
+        if self._completed is None:
+            self._completed = self._complete()
+        return self._completed
 
     def _complete(self) -> "SimpleDFA":
         """
@@ -213,25 +291,23 @@ class SimpleDFA(
         :return: the completed DFA.
         """
         sink_state = _generate_sink_name(self._states)
-        transitions = deepcopy(self._transition_function)
+        symbols = self._idx_to_symbol
 
         # for every missing transition, add a transition towards the sink state.
+        transitions = {}  # type: Dict[StateType, Dict[SymbolType, StateType]]
         for state in self._states:
-            for action in self._alphabet:
-                cur_transitions = self._transition_function.get(state, {})
-                end_state = cur_transitions.get(action, None)  # type: ignore
-                if end_state is None:
-                    transitions.setdefault(state, {})[action] = sink_state
+            transitions[state] = dict.fromkeys(symbols, sink_state)
+            transitions[state].update(self._transition_function.get(state, {}))
 
         # for every action, add a transition from the sink state to the sink state
-        for action in self._alphabet:
-            transitions.setdefault(sink_state, {})[action] = sink_state
+        transitions[sink_state] = dict.fromkeys(symbols, sink_state)
 
-        return SimpleDFA(
-            self.states.union({sink_state}),
-            self.alphabet,
-            self.initial_state,
-            self.accepting_states,
+        # the keys of the new transition function are exactly the new states.
+        return SimpleDFA._unchecked(
+            set(transitions),
+            self._alphabet,
+            self._initial_state,
+            self._accepting_states,
             transitions,
         )
 
@@ -239,85 +315,61 @@ class SimpleDFA(
         """
         Minimize the DFA.
 
+        The minimized DFA is computed at the first call only.
+
         :return: the minimized DFA.
         """
-        dfa = self
-        dfa = dfa.complete()
-
-        def greatest_fixpoint_condition(el: Tuple[int, int], current_set: Set):
-            """Condition to say whether the pair must be removed from the bisimulation relation."""
-            s, t = el
-            s_is_final = s in dfa._idx_accepting_states
-            t_is_final = t in dfa._idx_accepting_states
-            if s_is_final and not t_is_final or not s_is_final and t_is_final:
-                return True
-
-            s_transitions = dfa._idx_transition_function.get(s, {})
-            t_transitions = dfa._idx_transition_function.get(t, {})
-
-            for a, s_prime in s_transitions.items():
-                t_prime = t_transitions.get(a, None)
-                if t_prime is not None and (s_prime, t_prime) in current_set:
-                    continue
-                else:
-                    return True
-
-            for a, t_prime in t_transitions.items():
-                s_prime = s_transitions.get(a, None)
-                if s_prime is not None and (s_prime, t_prime) in current_set:
-                    continue
-                else:
-                    return True
-
-            return False
+        if self._minimized is None:
+            self._minimized = self._minimize()
+            # a minimal DFA is its own minimization.
+            self._minimized._minimized = self._minimized
+        return self._minimized
 
-        result = greatest_fixpoint(
-            set(
-                itertools.product(
-                    range(len(dfa._idx_to_state)), range(len(dfa._idx_to_state))
-                )
-            ),
-            condition=greatest_fixpoint_condition,
-        )
+    def _minimize(self) -> "SimpleDFA":
+        """
+        Minimize the DFA.
 
-        state2equiv_class = {}  # type: Dict[int, FrozenSet[int]]
-        for (s, t) in result:
-            state2equiv_class.setdefault(s, frozenset())
-            state2equiv_class[s] = state2equiv_class[s].union(frozenset({t}))
-        equivalence_classes = set(
-            map(lambda x: frozenset(x), state2equiv_class.values())
-        )
-        equiv_class2new_state = dict(
-            (ec, i) for i, ec in enumerate(equivalence_classes)
+        :return: the minimized DFA.
+        """
+        state2block, sink = valmari_lehtinen_refinement(
+            len(self._idx_to_state),
+            self._idx_accepting_states,
+            _live_states(self._idx_accepting_states, self._idx_predecessors()),
+            self._idx_delta,
         )
 
+        # the missing transitions, and the ones towards the sink block, go to the sink.
         new_transition_function = {}  # type: Dict[int, Dict[SymbolType, int]]
-        for state in dfa._idx_delta_by_state:
-            new_state = equiv_class2new_state[state2equiv_class[state]]
-            for action, next_state in dfa._idx_delta_by_state[state]:
-                new_next_state = equiv_class2new_state[state2equiv_class[next_state]]
-
-                new_transition_function.setdefault(new_state, {})[
-                    dfa._idx_to_symbol[action]
-                ] = new_next_state
-
-        new_states = frozenset(equiv_class2new_state.values())
-        new_initial_state = equiv_class2new_state[
-            state2equiv_class[dfa._idx_initial_state]
-        ]
-        new_final_states = frozenset(
-            s
-            for s in set(
-                equiv_class2new_state[state2equiv_class[old_state]]
-                for old_state in dfa._idx_accepting_states
-            )
-        )
+        for state, block in enumerate(state2block):
+            if block == sink or block in new_transition_function:
+                continue
+            new_transition_function[block] = {
+                symbol: state2block[next_state] if next_state != -1 else sink
+                for symbol, next_state in zip(
+                    self._idx_to_symbol, self._idx_delta[state]
+                )
+            }
+
+        new_states = set(state2block)
+        if sink in new_states or any(
+            sink in action2next_state.values()
+            for action2next_state in new_transition_function.values()
+        ):
+            new_states.add(sink)
+            new_transition_function[sink] = {
+                symbol: sink for symbol in self._idx_to_symbol
+            }
 
-        new_dfa = SimpleDFA(
-            set(new_states),
-            dfa.alphabet,
+        new_initial_state = state2block[self._idx_initial_state]
+        new_final_states = {
+            state2block[old_state] for old_state in self._idx_accepting_states
+        }
+
+        new_dfa = SimpleDFA._unchecked(
+            new_states,
+            self.alphabet,
             new_initial_state,
-            set(new_final_states),
+            new_final_states,
             new_transition_function,
         )
         return new_dfa
@@ -328,38 +380,8 @@ class SimpleDFA(
 
         :return: the reachable DFA.
         """
-
-        def reachable_fixpoint_rule(current_set: Set) -> Iterable:
-            result = set()
-            for el in current_set:
-                for a in self._idx_transition_function.get(el, {}):
-                    result.add(self._idx_transition_function[el][a])
-            return result
-
-        result = least_fixpoint({self._idx_initial_state}, reachable_fixpoint_rule)
-
-        idx_new_states = result
-        new_transition_function = {}
-        for s in idx_new_states:
-            for a in self._idx_transition_function.get(s, {}):
-                next_state = self._idx_transition_function[s][a]
-                if next_state in idx_new_states:
-                    new_transition_function.setdefault(self._idx_to_state[s], {})
-                    state = self._idx_to_state[s]
-                    new_transition_function[state][
-                        self._idx_to_symbol[a]
-                    ] = self._idx_to_state[next_state]
-
-        new_states = set(map(lambda x: self._idx_to_state[x], idx_new_states))
-        new_final_states = new_states.intersection(self._accepting_states)
-
-        return SimpleDFA(
-            new_states,
-            self.alphabet,
-            self._initial_state,
-            new_final_states,
-            new_transition_function,
-        )
+        idx_new_states = _reachable_states(self._idx_initial_state, self._idx_delta)
+        return self._restrict(idx_new_states)
 
     def coreachable(self) -> "SimpleDFA":
         """
@@ -367,45 +389,41 @@ class SimpleDFA(
 
         :return: the co-reachable DFA.
         """
-
-        def coreachable_fixpoint_rule(current_set: Set) -> Iterable:
-            # least fixpoint
-            result = set()
-            for s in range(len(self._states)):
-                for a in self._idx_transition_function.get(s, {}):
-                    next_state = self._idx_transition_function[s][a]
-                    if next_state in current_set:
-                        result.add(s)
-                        break
-            return result
-
-        result = least_fixpoint(
-            set(self._idx_accepting_states), coreachable_fixpoint_rule
+        idx_new_states = _live_states(
+            self._idx_accepting_states, self._idx_predecessors()
         )
-
-        idx_new_states = result
         if self._idx_initial_state not in idx_new_states:
             return EmptyDFA(alphabet=self.alphabet)
+        return self._restrict(idx_new_states)
+
+    def _restrict(self, idx_states: AbstractSet[int]) -> "SimpleDFA":
+        """
+        Restrict the DFA to a subset of its states.
+
+        :param idx_states: the indexes of the states to keep. It must include the initial state.
+        :return: the DFA with only those states, and the transitions among them.
+        """
+        if len(idx_states) == len(self._idx_to_state):
+            return self
 
-        new_states = set(map(lambda x: self._idx_to_state[x], idx_new_states))
         new_transition_function = (
             {}
         )  # type: Dict[StateType, Dict[SymbolType, StateType]]
-        for s in idx_new_states:
-            for a in self._idx_transition_function.get(s, {}):
-                next_state = self._idx_transition_function[s][a]
-                if next_state in idx_new_states:
-                    new_transition_function.setdefault(self._idx_to_state[s], {})
-                    state = self._idx_to_state[s]
-                    new_transition_function[state][
+        for s in idx_states:
+            for a, next_state in enumerate(self._idx_delta[s]):
+                if next_state in idx_states:
+                    new_transition_function.setdefault(self._idx_to_state[s], {})[
                         self._idx_to_symbol[a]
                     ] = self._idx_to_state[next_state]
 
-        return SimpleDFA(
+        new_states = set(map(self._idx_to_state.__getitem__, idx_states))
+        new_final_states = new_states.intersection(self._accepting_states)
+
+        return SimpleDFA._unchecked(
             new_states,
             self.alphabet,
-            self.initial_state,
-            set(self._accepting_states),
+            self._initial_state,
+            new_final_states,
             new_transition_function,
         )
 
@@ -415,11 +433,15 @@ class SimpleDFA(
 
         :return: the trimmed DFA.
         """
-        dfa = self
-        dfa = dfa.complete()
-        dfa = dfa.reachable()
-        dfa = dfa.coreachable()
-        return dfa
+        # the successors of a reachable state are reachable: hence, the states
+        # of the reachable DFA that are co-reachable are the reachable live states.
+        idx_live_states = _live_states(
+            self._idx_accepting_states, self._idx_predecessors()
+        )
+        if self._idx_initial_state not in idx_live_states:
+            return EmptyDFA(alphabet=self.alphabet)
+        idx_new_states = _reachable_states(self._idx_initial_state, self._idx_delta)
+        return self._restrict(idx_new_states.intersection(idx_live_states))
 
     def levels_to_accepting_states(self) -> dict:
         """
@@ -428,32 +450,22 @@ class SimpleDFA(
         i.e. the number of steps to reach any accepting state.
         level = -1 if the state cannot reach any accepting state
         """
-        res = {accepting_state: 0 for accepting_state in self.accepting_states}
-        level = 0
-
-        # least fixpoint
-        z_current = set()  # type: Set[StateType]
-        z_next = set(self.accepting_states)
-
-        while z_current != z_next:
-            level += 1
-            z_current = z_next
-            z_next = copy(z_current)
-            for state in self._transition_function:
-                for action in self._transition_function[state]:
-                    if state in z_current:
-                        continue
-                    next_state = self._transition_function[state][action]
-                    if next_state in z_current:
-                        z_next.add(state)
-                        res[state] = level
-                        break
-
-        z_current = z_next
-        for failure_state in filter(lambda x: x not in z_current, self._states):
-            res[failure_state] = -1
-
-        return res
+        predecessors = self._idx_predecessors()
+        idx_to_level = [-1] * len(self._idx_to_state)
+        for state in self._idx_accepting_states:
+            idx_to_level[state] = 0
+
+        # breadth-first visit of the inverse transitions, from the accepting states.
+        queue = deque(self._idx_accepting_states)
+        while queue:
+            state = queue.popleft()
+            level = idx_to_level[state] + 1
+            for predecessor in predecessors[state]:
+                if idx_to_level[predecessor] == -1:
+                    idx_to_level[predecessor] = level
+                    queue.append(predecessor)
+
+        return dict(zip(self._idx_to_state, idx_to_level))
 
     def renumbering(self) -> "SimpleDFA":
         """Deterministically renumber all the states.
@@ -461,32 +473,27 @@ class SimpleDFA(
         :raises ValueError: if the symbols of the transitions
                           | cannot be sorted uniquely
         """
-        idx = 0
-        visited_states = {self._idx_initial_state}
-        q = queue.Queue()  # type: queue.Queue
-
-        old_state_to_number = {}
-
-        q.put(self._idx_initial_state)
-        while not q.empty():
-            current_state = q.get()
-            old_state_to_number[current_state] = idx
-            idx += 1
-
-            try:
-                next_actions = sorted(
-                    self._idx_transition_function[current_state],
-                    key=lambda x: self._idx_to_symbol[x],
-                )
-            except TypeError:
-                raise TypeError("Cannot sort the transition symbols.")
-
-            for action in next_actions:
-                cur_tf = self._idx_transition_function[current_state]
-                next_state = cur_tf[action]
-                if next_state not in visited_states:
-                    visited_states.add(next_state)
-                    q.put(next_state)
+        try:
+            sorted_actions = sorted(
+                range(len(self._idx_to_symbol)), key=self._idx_to_symbol.__getitem__
+            )
+        except TypeError:
+            raise TypeError("Cannot sort the transition symbols.")
+
+        # breadth-first visit, following the transitions in the order of their symbols.
+        old_state_to_number = {self._idx_initial_state: 0}
+        q = deque([self._idx_initial_state])
+        while q:
+            next_states = self._idx_delta[q.popleft()]
+            for action in sorted_actions:
+                next_state = next_states[action]
+                if next_state != -1 and next_state not in old_state_to_number:
+                    old_state_to_number[next_state] = len(old_state_to_number)
+                    q.append(next_state)
+
+        # the unreachable states are numbered last.
+        for state in range(len(self._idx_to_state)):
+            old_state_to_number.setdefault(state, len(old_state_to_number))
 
         new_states = set(range(len(old_state_to_number)))
         new_initial_state = old_state_to_number[self._idx_initial_state]
@@ -495,13 +502,14 @@ class SimpleDFA(
         }
         new_transition_function = {
             old_state_to_number[start]: {
-                self._idx_to_symbol[symbol]: old_state_to_number[end]
-                for symbol, end in self._idx_transition_function[start].items()
+                self._idx_to_symbol[action]: old_state_to_number[end]
+                for action, end in enumerate(next_states)
+                if end != -1
             }
-            for start in self._idx_transition_function
+            for start, next_states in enumerate(self._idx_delta)
         }
 
-        return SimpleDFA(
+        return SimpleDFA._unchecked(
             cast(Set[StateType], new_states),
             self.alphabet,
             new_initial_state,
@@ -509,6 +517,54 @@ class SimpleDFA(
             cast(Dict[StateType, Dict[SymbolType, StateType]], new_transition_function),
         )
 
+    def accepts(self, word: Sequence[SymbolType]) -> bool:
+        """
+        Check whether the automaton accepts the word.
+
+        :param word: the list of symbols.
+        :return: True if the automaton accepts the word, False otherwise.
+        """
+        symbol_to_idx = self._symbol_to_idx
+        transition_table = self._idx_delta
+
+        current_state = self._idx_initial_state
+        for symbol in word:
+            action = symbol_to_idx.get(symbol, None)
+            if action is None:
+                return False
+            current_state = transition_table[current_state][action]
+            if current_state == -1:
+                return False
+        return current_state in self._idx_accepting_states
+
+    def accepts_words(self, words: Iterable[Sequence[SymbolType]]) -> List[bool]:
+        """
+        Check whether the automaton accepts each of the words.
+
+        The indexes of the automaton are looked up only once for all the words.
+
+        :param words: the words, i.e. lists of symbols.
+        :return: the list of the results, in the same order of the words.
+        """
+        initial_state = self._idx_initial_state
+        accepting_states = self._idx_accepting_states
+        symbol_to_idx = self._symbol_to_idx
+        transition_table = self._idx_delta
+
+        results = []
+        for word in words:
+            current_state = initial_state
+            for symbol in word:
+                action = symbol_to_idx.get(symbol, None)
+                if action is None:
+                    current_state = -1
+                    break
+                current_state = transition_table[current_state][action]
+                if current_state == -1:
+                    break
+            results.append(current_state in accepting_states)
+        return results
+
     def get_transitions_from(self, state: StateType) -> AbstractSet[TransitionType]:
         """
         Get the outgoing transitions from a state.
@@ -518,12 +574,15 @@ class SimpleDFA(
                  None if it is not possible to compute such set.
         :raises ValueError: if the state does not belong to the automaton.
         """
-        if state not in self.states:
-            raise ValueError("The state does not belong to the automaton.")
-
-        transitions = set()  # type: Set[TransitionType]
-        for guard, end in self._transition_function.get(state, {}).items():
-            transitions.add((state, guard, end))
+        transitions = self._transitions_from.get(state, None)
+        if transitions is None:
+            if state not in self._states:
+                raise ValueError("The state does not belong to the automaton.")
+            transitions = frozenset(
+                (state, guard, end)
+                for guard, end in self._transition_function.get(state, {}).items()
+            )
+            self._transitions_from[state] = transitions
 
         return transitions
 
@@ -581,33 +640,48 @@ class SimpleNFA(
         self._transition_function = (
             transition_function
         )  # type: Dict[StateType, Dict[SymbolType, Set[StateType]]]
+        self._successor_masks = None  # type: Optional[List[List[int]]]
+        self._transitions_from = (
+            {}
+        )  # type: Dict[StateType, FrozenSet[TransitionType]]
 
         self._build_indexes()
 
     def _build_indexes(self):
         self._idx_to_state = sorted(self._states)
-        self._state_to_idx = dict(map(reversed, enumerate(self._idx_to_state)))
+        self._state_to_idx = {s: i for i, s in enumerate(self._idx_to_state)}
         self._idx_to_symbol = sorted(self._alphabet)
-        self._symbol_to_idx = dict(map(reversed, enumerate(self._idx_to_symbol)))
-
-        # state -> action -> state
-        self._idx_transition_function = {
-            self._state_to_idx[state]: {
-                self._symbol_to_idx[symbol]: set(
-                    map(
-                        lambda x: self._state_to_idx[x],
-                        self._transition_function[state][symbol],
-                    )
-                )
-                for symbol in self._transition_function.get(state, {})
-            }
-            for state in self._states
-        }
+        self._symbol_to_idx = {a: i for i, a in enumerate(self._idx_to_symbol)}
 
         self._idx_initial_state = self._state_to_idx[self._initial_state]
         self._idx_accepting_states = frozenset(
             self._state_to_idx[s] for s in self._accepting_states
         )
+        self._idx_accepting_mask = sum(1 << s for s in self._idx_accepting_states)
+
+    def _idx_successor_masks(self) -> List[List[int]]:
+        """
+        Get the successors of every action and state, as bitmasks over the state indexes.
+
+        The table is built at the first call only.
+
+        :return: the table of the successors, indexed by action and then by state.
+        """
+        if self._successor_masks is None:
+            successor_masks = [
+                [0] * len(self._idx_to_state) for _ in self._idx_to_symbol
+            ]  # type: List[List[int]]
+            state_to_idx = self._state_to_idx
+            for state, symbol2next_states in self._transition_function.items():
+                for symbol, next_states in symbol2next_states.items():
+                    mask = 0
+                    for next_state in next_states:
+                        mask |= 1 << state_to_idx[next_state]
+                    successor_masks[self._symbol_to_idx[symbol]][
+                        state_to_idx[state]
+                    ] = mask
+            self._successor_masks = successor_masks
+        return self._successor_masks
 
     @classmethod
     def _check_input(
@@ -641,9 +715,21 @@ class SimpleNFA(
         return self._initial_state
 
     @property
-    def accepting_states(self) -> Set[StateType]:
+    def accepting_states(self) -> FrozenSet[StateType]:
         """Get the accepting states."""
-        return set(self._accepting_states)
+        return self._accepting_states
+
+    def is_accepting(self, state: StateType) -> bool:
+        """
+        Check whether a state is accepting.
+
+        :param state: the state of the automaton.
+        :return: True if the state is accepting, false otherwise.
+        :raise ValueError: if the state does not belong to the automaton.
+        """
+        if state not in self._states:
+            raise ValueError("The state does not belong to the automaton.")
+        return state in self._accepting_states
 
     @property
     def transition_function(self) -> Dict[StateType, Dict[SymbolType, Set[StateType]]]:
@@ -654,6 +740,64 @@ class SimpleNFA(
         """Get the successors states."""
         return self._transition_function.get(state, {}).get(symbol, set())
 
+    def accepts(self, word: Sequence[SymbolType]) -> bool:
+        """
+        Check whether the automaton accepts the word.
+
+        :param word: the list of symbols.
+        :return: True if the automaton accepts the word, False otherwise.
+        """
+        successor_masks = self._idx_successor_masks()
+        current_mask = 1 << self._idx_initial_state
+        for symbol in word:
+            action = self._symbol_to_idx.get(symbol, None)
+            if action is None:
+                return False
+            successors = successor_masks[action]
+            next_mask = 0
+            for state in _bit_indexes(current_mask):
+                next_mask |= successors[state]
+            if next_mask == 0:
+                return False
+            current_mask = next_mask
+        return current_mask & self._idx_accepting_mask != 0
+
+    def accepts_words(self, words: Iterable[Sequence[SymbolType]]) -> List[bool]:
+        """
+        Check whether the automaton accepts each of the words.
+
+        The steps from a set of states are computed once, and shared by all the words.
+
+        :param words: the words, i.e. lists of symbols.
+        :return: the list of the results, in the same order of the words.
+        """
+        successor_masks = self._idx_successor_masks()
+        symbol_to_idx = self._symbol_to_idx
+        initial_mask = 1 << self._idx_initial_state
+        accepting_mask = self._idx_accepting_mask
+        next_masks = {}  # type: Dict[Tuple[int, int], int]
+
+        results = []
+        for word in words:
+            current_mask = initial_mask
+            for symbol in word:
+                action = symbol_to_idx.get(symbol, None)
+                if action is None:
+                    current_mask = 0
+                    break
+                next_mask = next_masks.get((current_mask, action), None)
+                if next_mask is None:
+                    successors = successor_masks[action]
+                    next_mask = 0
+                    for state in _bit_indexes(current_mask):
+                        next_mask |= successors[state]
+                    next_masks[current_mask, action] = next_mask
+                current_mask = next_mask
+                if current_mask == 0:
+                    break
+            results.append(current_mask & accepting_mask != 0)
+        return results
+
     def determinize(self) -> SimpleDFA:
         """
         Do determinize the NFA.
@@ -661,35 +805,56 @@ class SimpleNFA(
         :return: the DFA equivalent to the DFA.
         """
         nfa = self
+        action2successors = nfa._idx_successor_masks()
+
+        # for every action, the bitmask of the states with some successor.
+        action2sources = [
+            sum(1 << state for state, successor in enumerate(successors) if successor)
+            for successors in action2successors
+        ]
 
-        new_states = {macro_state for macro_state in powerset(nfa._states)}
-        initial_state = frozenset([nfa._initial_state])
+        # only the macro states reachable from the initial one are built.
+        initial_mask = 1 << nfa._idx_initial_state
+        mask2next_masks = {}  # type: Dict[int, List[int]]
+        stack = [initial_mask]
+        while stack:
+            mask = stack.pop()
+            if mask in mask2next_masks:
+                continue
+            states = _bit_indexes(mask)
+            next_masks = []
+            for successors, sources in zip(action2successors, action2sources):
+                next_mask = 0
+                if mask & sources:
+                    for state in states:
+                        next_mask |= successors[state]
+                next_masks.append(next_mask)
+            mask2next_masks[mask] = next_masks
+            stack.extend(next_masks)
+
+        mask2state_set = {
+            mask: frozenset(map(nfa._idx_to_state.__getitem__, _bit_indexes(mask)))
+            for mask in mask2next_masks
+        }  # type: Dict[int, FrozenSet[StateType]]
+        accepting_mask = nfa._idx_accepting_mask
         final_states = {
-            q for q in new_states if len(q.intersection(nfa._accepting_states)) != 0
+            state_set
+            for mask, state_set in mask2state_set.items()
+            if mask & accepting_mask
         }
-        transition_function = (
-            {}
-        )  # type: Dict[FrozenSet[StateType], Dict[SymbolType, FrozenSet[StateType]]]
-
-        for state_set in new_states:
-            for action in nfa.alphabet:
-
-                next_macrostate = set()
-                for s in state_set:
-                    for next_state in nfa._transition_function.get(s, {}).get(
-                        action, set()
-                    ):
-                        next_macrostate.add(next_state)
-
-                transition_function.setdefault(state_set, {})[action] = frozenset(
-                    next_macrostate
-                )
+        transition_function = {
+            mask2state_set[mask]: {
+                symbol: mask2state_set[next_mask]
+                for symbol, next_mask in zip(nfa._idx_to_symbol, next_masks)
+            }
+            for mask, next_masks in mask2next_masks.items()
+        }  # type: Dict[FrozenSet[StateType], Dict[SymbolType, FrozenSet[StateType]]]
 
-        return SimpleDFA(
-            new_states,
+        return SimpleDFA._unchecked(
+            set(mask2state_set.values()),
             nfa.alphabet,
-            initial_state,
-            set(final_states),
+            mask2state_set[initial_mask],
+            final_states,
             transition_function,
         )
 
@@ -721,13 +886,18 @@ class SimpleNFA(
                  None if it is not possible to compute such set.
         :raises ValueError: if the state does not belong to the automaton.
         """
-        if state not in self.states:
-            raise ValueError("The state does not belong to the automaton.")
-
-        transitions = set()  # type: Set[TransitionType]
-        for guard, end_states in self._transition_function.get(state, {}).items():
-            for end_state in end_states:
-                transitions.add((state, guard, end_state))
+        transitions = self._transitions_from.get(state, None)
+        if transitions is None:
+            if state not in self._states:
+                raise ValueError("The state does not belong to the automaton.")
+            transitions = frozenset(
+                (state, guard, end_state)
+                for guard, end_states in self._transition_function.get(
+                    state, {}
+                ).items()
+                for end_state in end_states
+            )
+            self._transitions_from[state] = transitions
 
         return transitions
 
@@ -756,7 +926,7 @@ def _check_at_least_one_state(states: Set[StateType]):
 
 def _check_no_none_states(states: Set[StateType]):
     """Check that the set of states does not contain a None."""
-    if any(s is None for s in states):
+    if None in states:
         raise ValueError("A state cannot be 'None'.")
 
 
@@ -790,23 +960,23 @@ def _check_transition_function_is_valid_wrt_states_and_alphabet(
     if len(transition_function) == 0:
         return
 
-    extracted_states, extracted_alphabet = _extract_states_from_transition_function(
-        transition_function
-    )  # type: Set[StateType], Alphabet
-    if not all(s in states for s in extracted_states):
-        raise ValueError(
-            "Transition function not valid: "
-            "states {} are not in the set of states.".format(
-                extracted_states.difference(states)
+    alphabet_symbols = set(alphabet)
+    for start_state, symbol2end_state in transition_function.items():
+        end_states = symbol2end_state.values()
+        if start_state not in states or not states.issuperset(end_states):
+            raise ValueError(
+                "Transition function not valid: "
+                "states {} are not in the set of states.".format(
+                    {start_state, *end_states}.difference(states)
+                )
             )
-        )
-    if not all(s in alphabet for s in extracted_alphabet):
-        raise ValueError(
-            "Transition function not valid: "
-            "symbols {} are not in the alphabet.".format(
-                set(extracted_alphabet).difference(alphabet)
+        if not alphabet_symbols.issuperset(symbol2end_state):
+            raise ValueError(
+                "Transition function not valid: "
+                "symbols {} are not in the alphabet.".format(
+                    set(symbol2end_state).difference(alphabet_symbols)
+                )
             )
-        )
 
 
 def _check_nondet_transition_function_is_valid_wrt_states_and_alphabet(
@@ -816,35 +986,32 @@ def _check_nondet_transition_function_is_valid_wrt_states_and_alphabet(
     if len(transition_function) == 0:
         return
 
-    (
-        extracted_states,
-        extracted_alphabet,
-    ) = _extract_states_from_nondet_transition_function(
-        transition_function
-    )  # type: Set[StateType], Alphabet[SymbolType]
-    if not all(s in states for s in extracted_states):
-        raise ValueError(
-            "Transition function not valid: "
-            "states {} are not in the set of states.".format(
-                extracted_states.difference(states)
+    alphabet_symbols = set(alphabet)
+    for start_state, symbol2end_states in transition_function.items():
+        if start_state not in states or not states.issuperset(
+            chain.from_iterable(symbol2end_states.values())
+        ):
+            end_states = set().union(*symbol2end_states.values())
+            raise ValueError(
+                "Transition function not valid: "
+                "states {} are not in the set of states.".format(
+                    {start_state, *end_states}.difference(states)
+                )
+            )
+        if not alphabet_symbols.issuperset(symbol2end_states):
+            raise ValueError(
+                "Transition function not valid: "
+                "some symbols are not in the alphabet."
             )
-        )
-    if not all(s in alphabet for s in extracted_alphabet):
-        raise ValueError(
-            "Transition function not valid: " "some symbols are not in the alphabet."
-        )
 
 
 def _extract_states_from_nondet_transition_function(transition_function):
     # type: (Dict) -> Tuple[Set[StateType], Alphabet]
     """Extract states from a non-deterministic transition function."""
-    states, symbols = set(), set()
-    for start_state in transition_function:
-        states.add(start_state)
-        for symbol in transition_function[start_state]:
-            end_states = transition_function[start_state][symbol]
-            states = states.union(end_states)
-            symbols.add(symbol)
+    states, symbols = set(transition_function), set()
+    for symbol2end_states in transition_function.values():
+        symbols.update(symbol2end_states.keys())
+        states.update(*symbol2end_states.values())
 
     return states, MapAlphabet(symbols)
 
@@ -853,21 +1020,74 @@ def _extract_states_from_transition_function(
     transition_function: Dict,
 ) -> Tuple[Set[StateType], Alphabet]:
     """Extract states from a transition function."""
-    states, symbols = set(), set()
-    for start_state in transition_function:
-        states.add(start_state)
-        for symbol in transition_function[start_state]:
-            end_state = transition_function[start_state][symbol]
-            states.add(end_state)
-            symbols.add(symbol)
+    states, symbols = set(transition_function), set()
+    for symbol2end_state in transition_function.values():
+        symbols.update(symbol2end_state.keys())
+        states.update(symbol2end_state.values())
 
     return states, MapAlphabet(symbols)
 
 
+def _reachable_states(
+    initial_state: int, transition_table: List[List[int]]
+) -> Set[int]:
+    """
+    Get the states that can be reached from the initial state.
+
+    :param initial_state: the initial state.
+    :param transition_table: the successor of every state and action, or -1 if missing.
+    :return: the set of reachable states.
+    """
+    reachable_states = {initial_state}
+    stack = [initial_state]
+    while stack:
+        for next_state in transition_table[stack.pop()]:
+            if next_state not in reachable_states and next_state != -1:
+                reachable_states.add(next_state)
+                stack.append(next_state)
+    return reachable_states
+
+
+def _live_states(
+    accepting_states: AbstractSet[int], predecessors: List[List[int]]
+) -> Set[int]:
+    """
+    Get the states that can reach some accepting state.
+
+    :param accepting_states: the accepting states.
+    :param predecessors: the predecessors of every state.
+    :return: the set of live states.
+    """
+    live_states = set(accepting_states)
+    stack = list(accepting_states)
+    while stack:
+        for predecessor in predecessors[stack.pop()]:
+            if predecessor not in live_states:
+                live_states.add(predecessor)
+                stack.append(predecessor)
+    return live_states
+
+
+def _bit_indexes(mask: int) -> List[int]:
+    """
+    Get the indexes of the bits set in a bitmask.
+
+    :param mask: the bitmask.
+    :return: the list of the indexes, from the lowest.
+    """
+    indexes = []
+    while mask:
+        lowest_bit = mask & -mask
+        indexes.append(lowest_bit.bit_length() - 1)
+        mask ^= lowest_bit
+    return indexes
+
+
 def _generate_sink_name(states: Set[StateType]):
     """Generate a sink name."""
     sink_name = "sink"
-    while True:
-        if sink_name not in states:
-            return sink_name
-        sink_name = "_" + sink_name
+    counter = 0
+    while sink_name in states:
+        counter += 1
+        sink_name = "sink_{}".format(counter)
+    return sink_name
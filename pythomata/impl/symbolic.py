@@ -12,7 +12,18 @@ For further details, see:
 """
 import itertools
 import operator
-from typing import Set, Dict, Union, Any, Optional, FrozenSet, Tuple, AbstractSet
+from typing import (
+    Set,
+    Dict,
+    Union,
+    Any,
+    Optional,
+    FrozenSet,
+    Tuple,
+    AbstractSet,
+    Iterable,
+    List,
+)
 
 import sympy
 from sympy import Symbol, simplify, satisfiable, And, Not, Or
@@ -203,14 +214,15 @@ class SymbolicAutomaton(
 
     def determinize(self) -> "SymbolicDFA":
         """Do determinize."""
+        transition_function = self._transition_function
+        accepting_states = self.accepting_states
         macro_initial_state = frozenset([self._initial_state])  # type: FrozenSet[int]
+        # every macro state is interned to an integer id when discovered.
+        macro_state2id = {macro_initial_state: 0}  # type: Dict[FrozenSet[int], int]
         stack = [macro_initial_state]
-        visited = {macro_initial_state}
         macro_accepting_states = (
-            {macro_initial_state}
-            if macro_initial_state.intersection(self.accepting_states) != set()
-            else set()
-        )  # type: Set[FrozenSet[int]]
+            {0} if not macro_initial_state.isdisjoint(accepting_states) else set()
+        )  # type: Set[int]
         moves = set()
 
         # given an iterable of transitions (i.e. triples (source, guard, destination)),
@@ -225,11 +237,12 @@ class SymbolicAutomaton(
 
         while len(stack) > 0:
             macro_source = stack.pop()
+            macro_source_id = macro_state2id[macro_source]
             transitions = set(
                 [
                     (source, guard, dest)
                     for source in macro_source
-                    for dest, guard in self._transition_function.get(source, {}).items()
+                    for dest, guard in transition_function.get(source, {}).items()
                 ]
             )
             for transitions_subset in map(frozenset, iter_powerset(transitions)):
@@ -239,79 +252,41 @@ class SymbolicAutomaton(
                 phi_positive = And(*getguard(transitions_subset))
                 phi_negative = And(*map(Not, getguard(transitions_subset_negated)))
                 phi = phi_positive & phi_negative
-                if sympy.satisfiable(phi) is not False:
+                if satisfiable(phi) is not False:
                     macro_dest = frozenset(
                         gettarget(transitions_subset)
                     )  # type: FrozenSet[int]
-                    moves.add((macro_source, phi, macro_dest))
-                    if macro_dest not in visited:
-                        visited.add(macro_dest)
+                    macro_dest_id = macro_state2id.get(macro_dest)
+                    if macro_dest_id is None:
+                        macro_dest_id = len(macro_state2id)
+                        macro_state2id[macro_dest] = macro_dest_id
                         stack.append(macro_dest)
-                        if macro_dest.intersection(self.accepting_states) != set():
-                            macro_accepting_states.add(macro_dest)
+                        if not macro_dest.isdisjoint(accepting_states):
+                            macro_accepting_states.add(macro_dest_id)
+                    moves.add((macro_source_id, phi, macro_dest_id))
 
         return self._from_transitions(
-            visited, macro_initial_state, set(macro_accepting_states), moves
+            set(macro_state2id.values()), 0, macro_accepting_states, moves
         )
 
     def minimize(self) -> "SymbolicDFA":
         """Minimize the NFA."""
         dfa = self.determinize().complete()
-        equivalence_relation = set.union(
-            {(p, q) for p, q in itertools.product(dfa.accepting_states, repeat=2)},
-            {
-                (p, q)
-                for p, q in itertools.product(
-                    dfa.states.difference(dfa.accepting_states), repeat=2
-                )
-            },
-        )
+        result = _bisimilar_pairs(dfa)
+        state2newstate = _number_equivalence_classes(dfa.states, result)
 
-        def greatest_fixpoint_condition(el: Tuple[int, int], current_set: Set):
-            """Condition to say whether the pair must be removed from the bisimulation relation."""
-            # unpack the two states
-            s_source, t_source = el
-            for (s_dest, s_guard) in dfa._transition_function.get(s_source, {}).items():
-                for (t_dest, t_guard) in dfa._transition_function.get(
-                    t_source, {}
-                ).items():
-                    if (
-                        t_dest != s_dest
-                        and (s_dest, t_dest) not in current_set
-                        and satisfiable(And(s_guard, t_guard)) is not False
-                    ):
-                        return True
-
-        # TODO to improve.
-        result = greatest_fixpoint(
-            equivalence_relation, condition=greatest_fixpoint_condition
-        )
-        _state2class = {}  # type: Dict[int, Set[int]]
-        for a, b in result:
-            union = _state2class.get(a, {a}).union(_state2class.get(b, {b}))
-            for element in union:
-                _state2class[element] = union
-
-        state2class = {
-            k: frozenset(v) for k, v in _state2class.items()
-        }  # type: Dict[int, FrozenSet[int]]
-        equivalence_classes = set(map(lambda x: frozenset(x), state2class.values()))
-        class2newstate = dict((ec, i) for i, ec in enumerate(equivalence_classes))
-
-        new_states = set(class2newstate.values())
-        old_initial_state = dfa.initial_state
-        initial_state = class2newstate[state2class[old_initial_state]]
+        new_states = set(state2newstate.values())
+        initial_state = state2newstate[dfa.initial_state]
         final_states = {
-            class2newstate[state2class[final_state]]
-            for final_state in dfa.accepting_states
+            state2newstate[final_state] for final_state in dfa.accepting_states
         }
 
         # normalize transitions
         from_edge_to_guard = {}  # type: Dict[Tuple[int, int], BooleanFunction]
         for old_source in dfa._transition_function:
             for old_dest, guard in dfa._transition_function[old_source].items():
-                new_source = class2newstate[state2class[old_source]]
-                new_dest = class2newstate[state2class[old_dest]]
+                new_source = state2newstate[old_source]
+                new_dest = state2newstate[old_dest]
 
                 edge = (new_source, new_dest)
                 if edge in from_edge_to_guard:
@@ -353,10 +328,14 @@ class SymbolicAutomaton(
             state_to_indices[s] = new_index
             indices_to_state[new_index] = s
 
+        # group the guards by edge, so every edge is added (and simplified) once.
+        edge2guards = {}  # type: Dict[Tuple[int, int], List[BooleanFunction]]
         for (source, guard, destination) in transitions:
-            source_index = state_to_indices[source]
-            dest_index = state_to_indices[destination]
-            automaton.add_transition((source_index, guard, dest_index))
+            edge = (state_to_indices[source], state_to_indices[destination])
+            edge2guards.setdefault(edge, []).append(guard)
+
+        for (source_index, dest_index), guards in edge2guards.items():
+            automaton.add_transition((source_index, Or(*guards), dest_index))
 
         return automaton
 
@@ -427,3 +406,104 @@ class SymbolicDFA(SymbolicAutomaton, DFA):
         successors = super().get_successors(state, symbol)
         assert len(successors) < 2, "Transition must be deterministic"
         return next(iter(successors)) if len(successors) == 1 else None
+
+    # the guards of a completed automaton may overlap, so keep the
+    # simulation over sets of states rather than the single-state one.
+    accepts = FiniteAutomaton.accepts
+
+
+def _bisimilar_pairs(dfa: "SymbolicDFA") -> Set[Tuple[int, int]]:
+    """
+    Compute the pairs of distinct bisimilar states of a complete symbolic DFA.
+
+    The relation is symmetric and reflexive: only the pairs (p, q) with p < q
+    are kept, and the other ones are left implicit.
+
+    :param dfa: the complete symbolic DFA.
+    :return: the pairs (p, q) of bisimilar states, with p < q.
+    """
+    transition_function = dfa._transition_function
+    non_accepting_states = dfa.states.difference(dfa.accepting_states)
+    equivalence_relation = set.union(
+        set(itertools.combinations(sorted(dfa.accepting_states), 2)),
+        set(itertools.combinations(sorted(non_accepting_states), 2)),
+    )
+
+    def greatest_fixpoint_condition(el: Tuple[int, int], current_set: Set):
+        """Condition to say whether the pair must be removed from the bisimulation relation."""
+        # unpack the two states
+        s_source, t_source = el
+        for (s_dest, s_guard) in transition_function.get(s_source, {}).items():
+            for (t_dest, t_guard) in transition_function.get(t_source, {}).items():
+                if (
+                    t_dest != s_dest
+                    and (min(s_dest, t_dest), max(s_dest, t_dest)) not in current_set
+                    and satisfiable(And(s_guard, t_guard)) is not False
+                ):
+                    return True
+
+    predecessors = _predecessors(transition_function)
+
+    def greatest_fixpoint_dependents(el: Tuple[int, int], current_set: Set):
+        """Get the pairs whose condition might change after the pair is removed."""
+        s_dest, t_dest = el
+        for s_source in predecessors.get(s_dest, ()):
+            for t_source in predecessors.get(t_dest, ()):
+                if s_source != t_source:
+                    yield min(s_source, t_source), max(s_source, t_source)
+
+    return greatest_fixpoint(
+        equivalence_relation,
+        condition=greatest_fixpoint_condition,
+        dependents=greatest_fixpoint_dependents,
+    )
+
+
+def _predecessors(
+    transition_function: Dict[int, Dict[int, BooleanFunction]]
+) -> Dict[int, Set[int]]:
+    """
+    Get the predecessors of every state, ignoring the guards.
+
+    :param transition_function: the transition function.
+    :return: the set of predecessors of every state with some incoming transition.
+    """
+    predecessors = {}  # type: Dict[int, Set[int]]
+    for source, dest2guard in transition_function.items():
+        for dest in dest2guard:
+            predecessors.setdefault(dest, set()).add(source)
+    return predecessors
+
+
+def _number_equivalence_classes(
+    states: AbstractSet[int], equivalent_pairs: Iterable[Tuple[int, int]]
+) -> Dict[int, int]:
+    """
+    Number the equivalence classes induced by a set of pairs of equivalent states.
+
+    The classes are computed with a union-find structure, so no set of states
+    is ever built or hashed; the classes are numbered from 0 in order of
+    their smallest state.
+
+    :param states: the states.
+    :param equivalent_pairs: the pairs of equivalent states.
+    :return: the mapping from each state to the number of its class.
+    """
+    parent = {s: s for s in states}  # type: Dict[int, int]
+
+    def find(state: int) -> int:
+        while parent[state] != state:
+            parent[state] = parent[parent[state]]
+            state = parent[state]
+        return state
+
+    for a, b in equivalent_pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+
+    state2class = {}  # type: Dict[int, int]
+    root2class = {}  # type: Dict[int, int]
+    for state in sorted(states):
+        state2class[state] = root2class.setdefault(find(state), len(root2class))
+    return state2class
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """This module contains implements utilities to execute a finite automaton."""
+import itertools
 from abc import ABC, abstractmethod
-from functools import reduce
 from typing import Generic, Set, AbstractSet, Sequence
 
 from pythomata.core import StateType, SymbolType, FiniteAutomaton
@@ -10,6 +10,8 @@ from pythomata.core import StateType, SymbolType, FiniteAutomaton
 class AbstractSimulator(Generic[StateType, SymbolType], ABC):
     """An interface for a simulator of finite automata."""
 
+    __slots__ = ()
+
     @abstractmethod
     def step(self, s: SymbolType) -> AbstractSet[StateType]:
         """Make a transition, updating the current state of the simulator."""
@@ -44,6 +46,8 @@ class AutomatonSimulator(AbstractSimulator[StateType, SymbolType]):
     It keeps the state
     """
 
+    __slots__ = ("_automaton", "_is_started", "_initial_states", "_current_states")
+
     def __init__(self, automaton: FiniteAutomaton):
         """
         Initialize a simulator for a finite automaton.
@@ -52,9 +56,10 @@ class AutomatonSimulator(AbstractSimulator[StateType, SymbolType]):
         """
         self._automaton = automaton
         self._is_started = False  # type: bool
-        self._current_states = {
-            self._automaton.initial_state
-        }  # type: AbstractSet[StateType]
+        self._initial_states = frozenset(
+            [self._automaton.initial_state]
+        )  # type: AbstractSet[StateType]
+        self._current_states = self._initial_states  # type: AbstractSet[StateType]
 
     @property
     def automaton(self) -> FiniteAutomaton:
@@ -79,19 +84,17 @@ class AutomatonSimulator(AbstractSimulator[StateType, SymbolType]):
     def step(self, symbol: SymbolType) -> AbstractSet[StateType]:
         """Do a simulation step."""
         self._is_started = True
+        get_successors = self._automaton.get_successors
         next_macro_state = set()  # type: Set[StateType]
-        for state in self.cur_state:
-            next_macro_state = next_macro_state.union(
-                self.automaton.get_successors(state, symbol)
-            )
+        add_successors = next_macro_state.update
+        for state in self._current_states:
+            add_successors(get_successors(state, symbol))
         self._current_states = next_macro_state
         return next_macro_state
 
     def is_true(self) -> bool:
         """Check whether the simulator is in an accepting state."""
-        return not self.is_failed() and any(
-            s in self.automaton.accepting_states for s in self.cur_state
-        )
+        return not self.automaton.accepting_states.isdisjoint(self.cur_state)
 
     def is_failed(self) -> bool:
         """Check whether the simulator is in a failed state."""
@@ -99,18 +102,26 @@ class AutomatonSimulator(AbstractSimulator[StateType, SymbolType]):
 
     def reset(self) -> AbstractSet[StateType]:
         """Reset the simulator."""
-        self._current_states = {self.automaton.initial_state}
+        self._current_states = self._initial_states
         self._is_started = False
         return self.cur_state
 
     def accepts(self, subword: Sequence[SymbolType]) -> bool:
         """Check whether the subword is accepted from the current state of the simulator."""
+        if not self._is_started:
+            # the simulator is in the initial state: let the automaton
+            # use its own (possibly table-driven) word acceptance.
+            return self.automaton.accepts(subword)
+
+        get_successors = self.automaton.get_successors
         current_states = self.cur_state  # type: AbstractSet[StateType]
         for symbol in subword:
-            current_states = reduce(
-                set.union,  # type: ignore
-                [self.automaton.get_successors(s, symbol) for s in current_states],
-                set(),
+            if not current_states:
+                return False
+            current_states = set(
+                itertools.chain.from_iterable(
+                    get_successors(s, symbol) for s in current_states
+                )
             )
 
-        return any(state in self.automaton.accepting_states for state in current_states)
+        return not self.automaton.accepting_states.isdisjoint(current_states)
@@ -14,9 +14,10 @@ def powerset(iterable):
     """
     Compute the power set of an iterable object.
 
+    All the 2^n subsets are built eagerly; use iter_powerset
+    to consume them one at a time.
+
     >>> sorted([sorted(s) for s in powerset([1,2,3])])
     [[], [1], [1, 2], [1, 2, 3], [1, 3], [2], [2, 3], [3]]
     """
-    combs = iter_powerset(iterable)
-    res = set(frozenset(x) for x in combs)
-    return res
+    return set(map(frozenset, iter_powerset(iterable)))
@@ -1,5 +1,13 @@
 """This module contains tests for alphabets."""
-from pythomata.alphabets import ArrayAlphabet, VectorizedAlphabet
+import pytest
+
+from pythomata.alphabets import (
+    ArrayAlphabet,
+    VectorizedAlphabet,
+    MapAlphabet,
+    SymbolicAlphabet,
+    RangeIntAlphabet,
+)
 
 
 class TestVectorizedAlphabet:
@@ -21,3 +29,95 @@ class TestVectorizedAlphabet:
         assert va.get_symbol(6) == ("c", "a")
         assert va.get_symbol(7) == ("c", "b")
         assert va.get_symbol(8) == ("c", "c")
+
+    def test_iter(self):
+        """Test that the iteration follows the order of the indexes."""
+        a = ArrayAlphabet(["a", "b", "c"])
+        va = VectorizedAlphabet(a, 2)
+
+        assert list(va) == [va.get_symbol(i) for i in range(va.size)]
+
+
+class TestSymbolicAlphabet:
+    """Test symbolic alphabet."""
+
+    def test_iter(self):
+        """Test that the iteration follows the order of the indexes."""
+        alphabet = SymbolicAlphabet(3)
+
+        assert list(alphabet) == [alphabet.get_symbol(i) for i in range(alphabet.size)]
+
+    def test_get_symbol_index(self):
+        """Test get symbol index, also with sequences of symbols and invalid inputs."""
+        alphabet = SymbolicAlphabet(3)
+
+        assert alphabet.get_symbol_index("101") == 5
+        assert alphabet.get_symbol_index(("1", "0", "1")) == 5
+        for symbol in [5, None, (1, 0, 1), ("1", "0"), ["1", "0", "2"]]:
+            with pytest.raises(ValueError):
+                alphabet.get_symbol_index(symbol)
+
+
+class TestArrayAlphabet:
+    """Test array alphabet."""
+
+    def test_get_symbol_index(self):
+        """Test get symbol index."""
+        a = ArrayAlphabet(["a", "b", "c"])
+
+        assert a.get_symbol_index("a") == 0
+        assert a.get_symbol_index("b") == 1
+        assert a.get_symbol_index("c") == 2
+        with pytest.raises(ValueError):
+            a.get_symbol_index("d")
+        with pytest.raises(ValueError):
+            a.get_symbol_index(["a"])
+
+    def test_get_symbol_index_duplicated_symbols(self):
+        """Test that a duplicated symbol gets the index of its first occurrence."""
+        a = ArrayAlphabet(["a", "b", "a"])
+
+        assert a.get_symbol_index("a") == 0
+        assert a.get_symbol_index("b") == 1
+
+    def test_contains(self):
+        """Test contains."""
+        a = ArrayAlphabet(["a", "b", "c"])
+
+        assert a.contains("a")
+        assert not a.contains("d")
+        assert not a.contains(["a"])
+
+
+class TestMapAlphabet:
+    """Test map alphabet."""
+
+    def test_from_generator(self):
+        """Test that a map alphabet can be built from a one-shot iterable."""
+        a = MapAlphabet(s for s in ["a", "b", "c"])
+
+        assert a.size == 3
+        assert a.get_symbol_index("a") == 0
+        assert a.get_symbol_index("b") == 1
+        assert a.get_symbol_index("c") == 2
+
+    def test_contains(self):
+        """Test contains."""
+        a = MapAlphabet(["a", "b", "c"])
+
+        assert a.contains("a")
+        assert not a.contains("d")
+        assert not a.contains(["a"])
+
+
+class TestRangeIntAlphabet:
+    """Test range alphabet."""
+
+    def test_get_symbol_index(self):
+        """Test get symbol index."""
+        a = RangeIntAlphabet(10, start=2, step=3)
+
+        assert [a.get_symbol_index(s) for s in a] == list(range(a.size))
+        for symbol in [0, 3, 4, 11, "a"]:
+            with pytest.raises(ValueError):
+                a.get_symbol_index(symbol)
@@ -98,6 +98,38 @@ class TestSimpleDFA:
         )
         assert self.dfa == another_dfa
 
+    def test_get_transitions_from(self):
+        """Test that the outgoing transitions are computed only once."""
+        transitions = self.dfa.get_transitions_from(0)
+
+        assert transitions == {(0, "a", 0), (0, "b", 1), (0, "c", 2)}
+        assert self.dfa.get_transitions_from(0) is transitions
+        with pytest.raises(ValueError):
+            self.dfa.get_transitions_from(3)
+
+    def test_accepting_states_are_frozen(self):
+        """Test that the DFA does not share the set of accepting states of the caller."""
+        accepting_states = {1}
+        dfa = SimpleDFA({0, 1}, ["a"], 0, accepting_states, {0: {"a": 1}})
+        accepting_states.add(0)
+
+        assert dfa.accepting_states == frozenset({1})
+        assert not dfa.is_accepting(0)
+        assert not dfa.accepts([])
+
+    def test_attributes(self):
+        """Test that the state and transition attributes are stored."""
+        dfa = SimpleDFA({0, 1}, ["a"], 0, {1}, {0: {"a": 1}})
+
+        assert dfa.get_state_attribute(0, "color") is None
+        dfa.set_state_attribute(0, "color", "red")
+        assert dfa.get_state_attribute(0, "color") == "red"
+
+        transition = (0, "a", 1)
+        assert dfa.get_transition_attribute(transition, "weight") is None
+        dfa.set_transition_attribute(transition, "weight", 2)
+        assert dfa.get_transition_attribute(transition, "weight") == 2
+
 
 class TestPartialSimpleDFA:
     """Test a non-complete DFA."""
@@ -300,6 +332,26 @@ class TestComplete:
         actual_dfa = dfa.complete()
         assert actual_dfa == expected_dfa
 
+    def test_sink_name_already_used(self):
+        """Test that completion generates a fresh sink state when 'sink' is already a state."""
+        dfa = SimpleDFA(
+            {"sink", "sink_1"},
+            {"a", "b"},
+            "sink",
+            {"sink_1"},
+            {"sink": {"a": "sink_1"}},
+        )
+        completed = dfa.complete()
+
+        assert completed.states == {"sink", "sink_1", "sink_2"}
+        assert completed.get_successor("sink", "b") == "sink_2"
+
+    def test_complete_is_cached(self):
+        """Test that the completed SimpleDFA is computed only once."""
+        dfa = SimpleDFA({"q0"}, MapAlphabet({"a", "b"}), "q0", set(), {})
+
+        assert dfa.complete() is dfa.complete()
+
 
 class TestMinimize:
     def test_minimize(self):
@@ -325,6 +377,50 @@ class TestMinimize:
         assert actual_minimized_dfa._alphabet == ArrayAlphabet(["a", "b", "c"])
         assert actual_minimized_dfa.is_complete()
 
+    def test_minimize_without_sink(self):
+        """Test that no sink is added if every state can reach an accepting state."""
+        dfa = SimpleDFA(
+            {"q0", "q1", "q2"},
+            MapAlphabet({"a", "b"}),
+            "q0",
+            {"q1", "q2"},
+            {
+                "q0": {"a": "q1", "b": "q2"},
+                "q1": {"a": "q1", "b": "q0"},
+                "q2": {"a": "q2", "b": "q0"},
+            },
+        )
+
+        actual_minimized_dfa = dfa.minimize()
+
+        assert len(actual_minimized_dfa.states) == 2
+        assert actual_minimized_dfa.is_complete()
+        assert actual_minimized_dfa.accepts(["a", "b", "b"])
+        assert not actual_minimized_dfa.accepts(["b", "a", "b"])
+
+    def test_minimize_empty_language(self):
+        """Test that the minimized DFA of the empty language has only one state."""
+        dfa = SimpleDFA(
+            {"q0", "q1"}, MapAlphabet({"a"}), "q0", set(), {"q0": {"a": "q1"}}
+        )
+
+        actual_minimized_dfa = dfa.minimize()
+
+        assert len(actual_minimized_dfa.states) == 1
+        assert len(actual_minimized_dfa.accepting_states) == 0
+        assert actual_minimized_dfa.is_complete()
+
+    def test_minimize_is_cached(self):
+        """Test that the minimized SimpleDFA is computed only once."""
+        dfa = SimpleDFA(
+            {"q0", "q1"}, MapAlphabet({"a"}), "q0", {"q1"}, {"q0": {"a": "q1"}}
+        )
+
+        actual_minimized_dfa = dfa.minimize()
+
+        assert dfa.minimize() is actual_minimized_dfa
+        assert actual_minimized_dfa.minimize() is actual_minimized_dfa
+
     def test_every_minimized_dfa_is_complete(self):
         """Test that every minimized SimpleDFA is complete."""
         # TODO use Hypothesis
@@ -367,6 +463,15 @@ class TestReachable:
 
         assert actual_reachable_dfa == expected_reachable_dfa
 
+    def test_reachable_all_states_reachable(self):
+        """Test that the reachable SimpleDFA of a reachable SimpleDFA is the SimpleDFA itself."""
+
+        dfa = SimpleDFA(
+            {"q0", "q1"}, MapAlphabet({"a"}), "q0", {"q1"}, {"q0": {"a": "q1"}}
+        )
+
+        assert dfa.reachable() is dfa
+
 
 class TestCoReachable:
     def test_coreachable_simple_case(self):
@@ -430,6 +535,31 @@ class TestTrim:
 
         assert actual_trimmed_dfa == expected_trimmed_dfa
 
+    def test_trim_unreachable_and_dead_states(self):
+        """Test that trim removes both the unreachable and the dead states."""
+        dfa = SimpleDFA(
+            {"q0", "q1", "q2", "q3"},
+            MapAlphabet({"a", "b"}),
+            "q0",
+            {"q1"},
+            {"q0": {"a": "q1", "b": "q2"}, "q3": {"a": "q1"}},
+        )
+
+        expected_trimmed_dfa = SimpleDFA(
+            {"q0", "q1"}, MapAlphabet({"a", "b"}), "q0", {"q1"}, {"q0": {"a": "q1"}}
+        )
+
+        assert dfa.trim() == expected_trimmed_dfa
+        assert dfa.trim() == dfa.reachable().coreachable()
+
+    def test_trim_no_live_initial_state_gives_empty_dfa(self):
+        """Test that trim gives the empty DFA if the initial state is dead."""
+        dfa = SimpleDFA(
+            {"q0", "q1"}, MapAlphabet({"a"}), "q0", {"q1"}, {"q0": {"a": "q0"}}
+        )
+
+        assert dfa.trim() == EmptyDFA(MapAlphabet({"a"}))
+
 
 class TestAccepts:
     def test_accepts(self):
@@ -450,6 +580,65 @@ class TestAccepts:
         assert not dfa.accepts(["a", "a"])
         assert not dfa.accepts(["b", "b"])
 
+    def test_accepts_symbol_not_in_alphabet(self):
+        """Test that a word with a symbol outside the alphabet is rejected."""
+        dfa = SimpleDFA({"q0"}, MapAlphabet({"a"}), "q0", {"q0"}, {"q0": {"a": "q0"}})
+
+        assert dfa.accepts(["a", "a"])
+        assert not dfa.accepts(["a", "b"])
+
+    def test_accepts_words(self):
+        """Test that the batch acceptance agrees with the acceptance of every word."""
+        dfa = SimpleDFA(
+            {"q0", "q1"},
+            MapAlphabet({"a", "b"}),
+            "q0",
+            {"q1"},
+            {"q0": {"a": "q0", "b": "q1"}},
+        )
+        words = [[], ["b"], ["a", "b"], ["b", "b"], ["c"], ["a", "c", "b"]]
+
+        assert dfa.accepts_words(words) == [dfa.accepts(word) for word in words]
+        assert dfa.accepts_words(words) == [False, True, True, False, False, False]
+
+
+class TestRenumbering:
+    def test_renumbering(self):
+        """Test that the states are numbered in breadth-first order, by symbol."""
+        dfa = SimpleDFA(
+            {"q0", "q1", "q2", "q3"},
+            MapAlphabet({"a", "b"}),
+            "q0",
+            {"q2"},
+            {"q0": {"b": "q1", "a": "q2"}, "q2": {"a": "q1", "b": "q3"}},
+        )
+
+        expected_dfa = SimpleDFA(
+            {0, 1, 2, 3},
+            MapAlphabet({"a", "b"}),
+            0,
+            {1},
+            {0: {"a": 1, "b": 2}, 1: {"a": 2, "b": 3}, 2: {}, 3: {}},
+        )
+
+        assert dfa.renumbering() == expected_dfa
+
+    def test_renumbering_unreachable_states(self):
+        """Test that the unreachable states are numbered last."""
+        dfa = SimpleDFA(
+            {"q0", "q1", "q2"},
+            MapAlphabet({"a"}),
+            "q0",
+            {"q1"},
+            {"q0": {"a": "q1"}, "q2": {"a": "q0"}},
+        )
+
+        expected_dfa = SimpleDFA(
+            {0, 1, 2}, MapAlphabet({"a"}), 0, {1}, {0: {"a": 1}, 1: {}, 2: {"a": 0}}
+        )
+
+        assert dfa.renumbering() == expected_dfa
+
 
 class TestLevelToAcceptingStates:
     def test_level_to_accepting_states(self):
@@ -28,6 +28,29 @@ class TestNFA:
         assert nfa_1 == nfa_2
         assert nfa_1 != tuple()
 
+    def test_is_accepting(self):
+        """Test is_accepting."""
+        nfa = SimpleNFA({"q0", "q1"}, {"a0"}, "q0", {"q1"}, {"q0": {"a0": {"q1"}}})
+
+        assert not nfa.is_accepting("q0")
+        assert nfa.is_accepting("q1")
+        with pytest.raises(ValueError):
+            nfa.is_accepting("q2")
+
+    def test_accepts_words(self):
+        """Test that the batch acceptance agrees with the acceptance of every word."""
+        nfa = SimpleNFA(
+            {"q0", "q1", "q2"},
+            {"a0", "a1"},
+            "q0",
+            {"q2"},
+            {"q0": {"a0": {"q1", "q2"}}, "q1": {"a1": {"q2"}}},
+        )
+
+        assert nfa.accepts_words(
+            [[], ["a0"], ["a0", "a1"], ["a1"], ["a0", "a1"], ["a2"]]
+        ) == [False, True, True, False, True, False]
+
     def test_nfa_from_transitions(self):
         """Test that the constructor "from_transitions" works correctly."""
 
@@ -156,6 +179,29 @@ class TestDeterminize:
         assert not actual_dfa.accepts(["a", "a", "a", "b"])
         assert actual_dfa.accepts(["a", "a", "a", "b", "b", "a", "b"])
 
+    def test_determinize_only_reachable_macro_states(self):
+        """Test that the unreachable macro states are not built."""
+        states = {"q{}".format(i) for i in range(30)}
+        nfa = SimpleNFA(
+            states,
+            MapAlphabet({"a", "b"}),
+            "q0",
+            {"q1"},
+            {"q0": {"a": {"q0", "q1"}}},
+        )
+
+        actual_dfa = nfa.determinize()
+
+        assert actual_dfa.states == {
+            frozenset({"q0"}),
+            frozenset({"q0", "q1"}),
+            frozenset(),
+        }
+        assert actual_dfa.accepting_states == {frozenset({"q0", "q1"})}
+        assert actual_dfa.is_complete()
+        assert actual_dfa.accepts(["a", "a"])
+        assert not actual_dfa.accepts(["a", "b"])
+
 
 class TestToGraphviz:
     def test_to_graphviz(self):